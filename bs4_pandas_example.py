@@ -4,128 +4,221 @@ It extracts details such as property titles (prices), addresses, number of bedro
 number of bathrooms, square footage, and stores this information in an SQLite database.
 
 The script performs the following tasks:
-1. Scrapes property listings from the specified location.
+1. Scrapes property listings from the specified locations, fetching pages concurrently.
 2. Cleans and converts price strings to numeric values for sorting and database storage.
 3. Creates an SQLite database (if it doesn't already exist) and defines a table for listings.
 4. Inserts new listings into the database while avoiding duplicates based on price.
 5. Logs progress and any issues encountered during the scraping process.
 
-To use this script, modify the 'location' variable in the main function to specify
-the desired area for real estate listings.
+To use this script, modify the 'locations' list in the main function to specify
+the desired areas for real estate listings.
 """
 
-import requests
+import asyncio
+import aiohttp
 import pandas as pd
 import json
 import logging
 import sqlite3
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 # Set up logging for tracking the scraping process
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class RealEstateScraper:
+    # Characters removed from price strings in a single str.translate pass
+    _PRICE_STRIP = str.maketrans('', '', '$, ')
+
+    # XPath expressions compiled once at import time rather than on every page.
+    # Classes are matched as whole tokens, like BeautifulSoup's class_ filter.
+    _CARD_PRED = "contains(concat(' ', normalize-space(@class), ' '), ' component_property-card ')"
+    _CARDS = etree.XPath(f'//li[{_CARD_PRED}][not(ancestor::li[{_CARD_PRED}])]')
+    _PRICE = etree.XPath("normalize-space(.//span[contains(concat(' ', normalize-space(@class), ' '), ' listing-price ')])")
+    _ADDRESS = etree.XPath("normalize-space(.//span[contains(concat(' ', normalize-space(@class), ' '), ' listing-address ')])")
+    _BEDS = etree.XPath("normalize-space(.//li[contains(concat(' ', normalize-space(@class), ' '), ' data-value ')]"
+                        "[contains(concat(' ', normalize-space(@class), ' '), ' beds ')])")
+    _BATHS = etree.XPath("normalize-space(.//li[contains(concat(' ', normalize-space(@class), ' '), ' data-value ')]"
+                         "[contains(concat(' ', normalize-space(@class), ' '), ' baths ')])")
+    _SQFT = etree.XPath("normalize-space(.//li[contains(concat(' ', normalize-space(@class), ' '), ' data-value ')]"
+                        "[contains(concat(' ', normalize-space(@class), ' '), ' sq ')]"
+                        "[contains(concat(' ', normalize-space(@class), ' '), ' ft ')])")
+
     def __init__(self):
-        self.listings = []
+        # One list per column (structure of arrays) rather than a dict per listing
+        self.titles = []
+        self.addresses = []
+        self.beds = []
+        self.baths = []
+        self.sqfts = []
+        self.prices = []
         self.base_url = 'https://www.realtor.com/realestateandhomes-search/'
         self.database = 'real_estate_listings.db'
+
+        # One long-lived connection in autocommit mode; transactions are opened explicitly
+        self.conn = sqlite3.connect(self.database, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self.conn.execute('PRAGMA cache_size=-65536')  # 64 MiB page cache
         self.create_database()
 
     def create_database(self):
         """Create an SQLite database and a table for listings."""
-        with sqlite3.connect(self.database) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS listings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT,
-                    address TEXT,
-                    bedrooms TEXT,
-                    bathrooms TEXT,
-                    square_footage TEXT,
-                    price_value REAL UNIQUE
-                )
-            ''')
-            conn.commit()
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS listings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                address TEXT,
+                bedrooms TEXT,
+                bathrooms TEXT,
+                square_footage TEXT,
+                price_value REAL UNIQUE
+            )
+        ''')
 
     def scrape_page(self, location):
         """Scrape property listings from a specific location."""
-        page_url = f'{self.base_url}{location}'
-        logging.info(f'Scraping {page_url}...')
-        
+        self.scrape_all_listings([location])
+
+    async def fetch(self, session, url, retries=3, backoff_factor=0.3):
+        """Download a single results page, retrying transient failures with exponential backoff."""
+        logging.info(f'Scraping {url}...')
+        for attempt in range(retries + 1):
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()  # Raise an error for bad responses
+                    # Hand lxml the raw bytes; it detects the encoding itself
+                    return await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Client errors other than rate limiting won't succeed on retry
+                if isinstance(e, aiohttp.ClientResponseError) and e.status < 500 and e.status != 429:
+                    raise
+                if attempt == retries:
+                    raise
+                await asyncio.sleep(backoff_factor * 2 ** attempt)
+
+    async def scrape_all_async(self, locations):
+        """Fetch all locations concurrently and parse them off the event loop."""
+        urls = [f'{self.base_url}{location}' for location in locations]
+        loop = asyncio.get_running_loop()
+
+        # Pooled keep-alive connections, capped so the site isn't flooded
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=10)) as session:
+            pages = await asyncio.gather(*[self.fetch(session, url) for url in urls], return_exceptions=True)
+
+        # Parsing is CPU-bound, so keep it in the default thread pool
+        parsed = []
+        for url, page in zip(urls, pages):
+            if isinstance(page, Exception):
+                logging.error(f"Request error for {url}: {page}")
+                continue
+            parsed.append((url, loop.run_in_executor(None, self.parse_listings, page)))
+
+        for url, future in parsed:
+            cards = await future
+            self.add_listings(cards)
+            logging.info(f'Found {len(cards)} properties on {url}.')
+
+    def add_listings(self, cards):
+        """Append parsed listing tuples to the per-column listing lists."""
+        for title, address, beds, baths, sqft in cards:
+            self.titles.append(title)
+            self.addresses.append(address)
+            self.beds.append(beds)
+            self.baths.append(baths)
+            self.sqfts.append(sqft)
+            # Clean and convert price to a number for sorting
+            self.prices.append(self.clean_price(title))
+
+    def parse_listings(self, html):
+        """Extract (title, address, beds, baths, sqft) tuples from a results page."""
         try:
-            response = requests.get(page_url)
-            response.raise_for_status()  # Raise an error for bad responses
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            properties = soup.find_all('li', class_='component_property-card')
-
-            for property in properties:
-                title_tag = property.find('span', class_='listing-price')
-                address_tag = property.find('span', class_='listing-address')
-                beds_tag = property.find('li', class_='data-value beds')
-                baths_tag = property.find('li', class_='data-value baths')
-                sqft_tag = property.find('li', class_='data-value sq ft')
-
-                # Extracting data with fallback for missing information
-                title = title_tag.get_text(strip=True) if title_tag else 'No Price'
-                address = address_tag.get_text(strip=True) if address_tag else 'No Address'
-                beds = beds_tag.get_text(strip=True) if beds_tag else 'N/A'
-                baths = baths_tag.get_text(strip=True) if baths_tag else 'N/A'
-                sqft = sqft_tag.get_text(strip=True) if sqft_tag else 'N/A'
-
-                # Clean and convert price to a number for sorting
-                price_value = self.clean_price(title)
-
-                # Append to the listings list as a dictionary
-                self.listings.append({
-                    'Title': title,
-                    'Address': address,
-                    'Bedrooms': beds,
-                    'Bathrooms': baths,
-                    'Square Footage': sqft,
-                    'Price Value': price_value  # Store numeric value for sorting
-                })
-
-            logging.info(f'Found {len(properties)} properties on {page_url}.')
-
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Request error: {e}")
+            return self._parse_with_lxml(html)
+        except etree.ParserError as e:
+            # lxml refuses documents it cannot build a tree from (e.g. empty bodies)
+            logging.warning(f"lxml failed to parse page, falling back to BeautifulSoup: {e}")
+            return self._parse_with_bs4(html)
+
+    def _parse_with_lxml(self, html):
+        """Parse listing cards with compiled lxml XPath expressions, one C-level evaluation per field."""
+        doc = lxml.html.fromstring(html)
+        return [
+            (
+                self._PRICE(card) or 'No Price',
+                self._ADDRESS(card) or 'No Address',
+                self._BEDS(card) or 'N/A',
+                self._BATHS(card) or 'N/A',
+                self._SQFT(card) or 'N/A',
+            )
+            for card in self._CARDS(doc)
+        ]
+
+    def _parse_with_bs4(self, html):
+        """Parse listing cards with BeautifulSoup, matching the lxml path's selection and fallbacks."""
+        def text(tag, fallback):
+            # Empty elements get the fallback too, as normalize-space() yields '' for them
+            return (' '.join(tag.get_text().split()) if tag else '') or fallback
+
+        soup = BeautifulSoup(html, 'lxml')
+        cards = [card for card in soup.select('li.component_property-card')
+                 if card.find_parent('li', class_='component_property-card') is None]
+        return [
+            (
+                text(card.select_one('span.listing-price'), 'No Price'),
+                text(card.select_one('span.listing-address'), 'No Address'),
+                text(card.select_one('li.data-value.beds'), 'N/A'),
+                text(card.select_one('li.data-value.baths'), 'N/A'),
+                text(card.select_one('li.data-value.sq.ft'), 'N/A'),
+            )
+            for card in cards
+        ]
 
     def clean_price(self, price_str):
         """Convert price string to a numeric value."""
+        price_str = price_str.translate(self._PRICE_STRIP)
+        if not price_str:
+            return float('inf')
         try:
-            return float(price_str.replace('$', '').replace(',', '').strip())
+            return float(price_str)  # float() tolerates any remaining surrounding whitespace
         except ValueError:
             return float('inf')  # Assign a high value for sorting if conversion fails
 
-    def scrape_all_listings(self, location):
-        """Scrape all listings for a given location."""
-        self.scrape_page(location)
+    def scrape_all_listings(self, locations):
+        """Scrape all listings for the given locations concurrently."""
+        asyncio.run(self.scrape_all_async(locations))
 
     def save_to_database(self):
-        """Insert or update listings in the SQLite database."""
-        with sqlite3.connect(self.database) as conn:
-            cursor = conn.cursor()
-            for listing in self.listings:
-                try:
-                    cursor.execute('''
-                        INSERT INTO listings (title, address, bedrooms, bathrooms, square_footage, price_value)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (listing['Title'], listing['Address'], listing['Bedrooms'], listing['Bathrooms'], listing['Square Footage'], listing['Price Value']))
-                except sqlite3.IntegrityError:
-                    logging.info(f"Listing already exists in database: {listing['Title']}")
-                    # Optionally update existing record here if needed
-
-            conn.commit()
-            logging.info(f'Saved {len(self.listings)} listings to the database.')
+        """Insert new listings into the SQLite database, skipping duplicates."""
+        changes_before = self.conn.total_changes
+
+        # The whole batch is a single explicit transaction
+        self.conn.execute('BEGIN')
+        try:
+            self.conn.executemany('''
+                INSERT OR IGNORE INTO listings (title, address, bedrooms, bathrooms, square_footage, price_value)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', zip(self.titles, self.addresses, self.beds, self.baths, self.sqfts, self.prices))
+        except sqlite3.Error:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+
+        inserted = self.conn.total_changes - changes_before
+        logging.info(f'Saved {inserted} new listings to the database '
+                     f'({len(self.titles) - inserted} already existed).')
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
 
 def main():
-    location = 'Los-Angeles_CA'  # Change this to your desired location
+    locations = ['Los-Angeles_CA']  # Change this to your desired locations
     scraper = RealEstateScraper()
     
     try:
-        scraper.scrape_all_listings(location)
+        asyncio.run(scraper.scrape_all_async(locations))
         
         # Save results to the SQLite database
         scraper.save_to_database()
@@ -133,5 +226,8 @@ def main():
     except Exception as e:
         logging.error(f'An error occurred: {e}')
 
+    finally:
+        scraper.close()
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
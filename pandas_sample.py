@@ -1,9 +1,9 @@
 '''
 The code revolves around two main classes: DataFrameProcessor and SalaryProcessor, along with a supporting class PopulationProcessor. These classes offer functionalities to process and manipulate pandas DataFrames.
 
-    DataFrameProcessor Class: This class provides generic DataFrame processing methods such as sorting, filtering, calculating statistics, adding and dropping columns.
+    DataFrameProcessor Class: This class provides generic DataFrame processing methods such as loading from SQLite, sorting, filtering, calculating statistics (with pandas or DuckDB), adding and dropping columns.
 
-    SalaryProcessor Class (Inherits DataFrameProcessor): This class extends the functionality of DataFrameProcessor with specific methods related to salary data processing, like calculating average salary by city, adding a bonus column, and calculating total income.
+    SalaryProcessor Class (Inherits DataFrameProcessor): This class extends the functionality of DataFrameProcessor with specific methods related to salary data processing, like calculating average salary by city, adding a bonus column, and calculating total income (separately or fused into a single pass).
 
     PopulationProcessor Class: This class deals with population-related data. It includes methods to merge DataFrames and save DataFrame contents to a CSV file.
 
@@ -11,6 +11,8 @@ The script generates sample data, creates an instance of SalaryProcessor to proc
 
 '''
 
+import sqlite3
+from contextlib import closing
 import pandas as pd
 import numpy as np
 
@@ -27,6 +29,24 @@ class DataFrameProcessor:
         """
         self.df = df
     
+    @classmethod
+    def load_from_sqlite(cls, db_path, query):
+        """
+        Creates a processor from the result of a SQL query against an SQLite database.
+
+        The result set is bulk-loaded by pd.read_sql instead of iterating cursor rows.
+
+        Args:
+            db_path (str): Path to the SQLite database file.
+            query (str): SQL query selecting the rows to load.
+
+        Returns:
+            DataFrameProcessor: Processor wrapping the loaded DataFrame.
+        """
+        with closing(sqlite3.connect(db_path)) as conn:
+            df = pd.read_sql(query, conn)
+        return cls(df)
+    
     def sort_by_column(self, column, ascending=True):
         """
         Sorts the DataFrame by a specified column.
@@ -44,6 +64,10 @@ class DataFrameProcessor:
         """
         Filters the DataFrame by a specified column and value.
 
+        The predicate is evaluated by DataFrame.query (numexpr when available).
+        For repeated lookups on a numeric column, sort once and use
+        filter_by_sorted_column() for an O(log n) search instead of a full scan.
+
         Args:
             column (str): Name of the column to filter by.
             value: Value to filter on.
@@ -51,7 +75,25 @@ class DataFrameProcessor:
         Returns:
             DataFrame: Filtered DataFrame.
         """
-        return self.df[self.df[column] == value]
+        return self.df.query(f"`{column}` == @value")
+    
+    def filter_by_sorted_column(self, column, value):
+        """
+        Filters the DataFrame by a column that is already sorted in ascending order.
+
+        Uses binary search to find the matching slice instead of scanning every row.
+
+        Args:
+            column (str): Name of the sorted column to filter by.
+            value: Value to filter on.
+
+        Returns:
+            DataFrame: Filtered DataFrame.
+        """
+        values = self.df[column].to_numpy()
+        start = values.searchsorted(value, side='left')
+        end = values.searchsorted(value, side='right')
+        return self.df.iloc[start:end]
     
     def calculate_statistics(self):
         """
@@ -62,6 +104,20 @@ class DataFrameProcessor:
         """
         return self.df.describe()
     
+    def calculate_statistics_duckdb(self):
+        """
+        Calculates statistics for the DataFrame with DuckDB's vectorized engine.
+
+        Faster than describe() on large DataFrames. The result follows DuckDB's
+        SUMMARIZE layout (one row per column) rather than describe()'s.
+        Requires the optional duckdb package.
+
+        Returns:
+            DataFrame: DataFrame containing statistics.
+        """
+        import duckdb
+        return duckdb.from_df(self.df).query('df', "SUMMARIZE SELECT * FROM df").df()
+    
     def add_column(self, name, values):
         """
         Adds a new column to the DataFrame.
@@ -101,6 +157,23 @@ class SalaryProcessor(DataFrameProcessor):
         """
         return self.df.groupby('city')['salary'].mean()
     
+    def calculate_avg_salary_by_city_duckdb(self):
+        """
+        Calculates the average salary by city with DuckDB's vectorized aggregation.
+
+        Same result as calculate_avg_salary_by_city(), but faster on large DataFrames.
+        Rows without a city are excluded, as pandas' groupby does.
+        Requires the optional duckdb package.
+
+        Returns:
+            Series: Series containing average salary by city.
+        """
+        import duckdb
+        result = duckdb.from_df(self.df).query(
+            'df', "SELECT city, AVG(salary) AS salary FROM df WHERE city IS NOT NULL GROUP BY city ORDER BY city"
+        ).df()
+        return result.set_index('city')['salary']
+    
     def add_bonus_column(self):
         """
         Adds a bonus column to the DataFrame with random values.
@@ -108,7 +181,8 @@ class SalaryProcessor(DataFrameProcessor):
         Returns:
             DataFrame: DataFrame with the bonus column added.
         """
-        self.df['bonus'] = np.random.randint(500, 2000, size=len(self.df))
+        n = len(self.df)
+        self.df['bonus'] = np.random.randint(500, 2000, size=n)
         return self.df
     
     def calculate_total_income(self):
@@ -118,7 +192,24 @@ class SalaryProcessor(DataFrameProcessor):
         Returns:
             DataFrame: DataFrame with total income column added.
         """
-        self.df['total_income'] = self.df['salary'] + self.df['bonus']
+        # Add the raw arrays to skip Series index alignment
+        self.df['total_income'] = self.df['salary'].to_numpy() + self.df['bonus'].to_numpy()
+        return self.df
+    
+    def add_bonus_and_total_income(self):
+        """
+        Adds a random bonus column and the resulting total income column in one pass.
+
+        Equivalent to add_bonus_column() followed by calculate_total_income(), but
+        reuses the freshly generated bonus array instead of reading the column back.
+
+        Returns:
+            DataFrame: DataFrame with bonus and total income columns added.
+        """
+        n = len(self.df)
+        bonus = np.random.randint(500, 2000, size=n)
+        self.df['bonus'] = bonus
+        self.df['total_income'] = self.df['salary'].to_numpy() + bonus
         return self.df
 
 class PopulationProcessor:
@@ -154,7 +245,7 @@ class PopulationProcessor:
         Args:
             filename (str): Name of the CSV file.
         """
-        self.df.to_csv(filename, index=False)
+        self.df.to_csv(filename, index=False, chunksize=100_000)
         print("DataFrame saved to '{}'".format(filename))
 
 # Generate sample data
@@ -179,11 +270,8 @@ filtered_df = salary_processor.filter_by_column('age', 25)
 # Calculate statistics
 stats = salary_processor.calculate_statistics()
 
-# Add bonus column
-df_with_bonus = salary_processor.add_bonus_column()
-
-# Calculate total income
-df_with_income = salary_processor.calculate_total_income()
+# Add bonus column and calculate total income
+df_with_income = salary_processor.add_bonus_and_total_income()
 
 # Drop a column
 df_dropped_column = salary_processor.drop_column('bonus')
@@ -4,28 +4,31 @@ The script is designed to perform the following tasks:
 Search through a folder and its subfolders recursively until it finds a specific file specified by the user.
 Once the target file is found, it copies the file to another location.
 It then retrieves a list of files from the location where the target file was copied to.
-It generates a JSON object containing information about each file, including the file path, size, and type (file or directory).
-The JSON object is then inserted into a pandas DataFrame.
+It builds a list containing information about each file, including the file path, size, and type (file, symlink or other).
+The list is loaded directly into a pandas DataFrame (calling the FileSearch object still returns the same data as JSON).
 Finally, the DataFrame is saved as a CSV file.
 
 '''
 
 import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import shutil
-import json
+import orjson
 import pandas as pd
 
 class FileSearch:
-    def __init__(self, start_path, target_file):
+    def __init__(self, start_path, target_file, max_workers=16):
         """
         Initialize the FileSearch object.
 
         Args:
             start_path (str): The root path to start the search.
             target_file (str): The name of the file to search for.
+            max_workers (int, optional): Number of threads scanning directories in parallel. Defaults to 16.
         """
         self.start_path = start_path
         self.target_file = target_file
+        self.max_workers = max_workers
         self.found_file_path = None
 
     def __call__(self):
@@ -33,12 +36,23 @@ class FileSearch:
         Performs the file search and returns the list of files as JSON if the target file is found.
 
         Returns:
-            str or None: JSON string containing file properties or None if target file is not found.
+            bytes or None: UTF-8 encoded JSON containing file properties or None if target file is not found.
+        """
+        files_list = self.get_files_list()
+        if files_list is None:
+            return None
+        return self._generate_json(files_list)
+
+    def get_files_list(self):
+        """
+        Performs the file search and returns the list of files if the target file is found.
+
+        Returns:
+            list or None: List of dictionaries containing file properties or None if target file is not found.
         """
         self._search_file(self.start_path)
         if self.found_file_path:
-            files_list = self._get_files_list(self.found_file_path)
-            return self._generate_json(files_list)
+            return self._get_files_list(self.found_file_path)
         else:
             print(f"File '{self.target_file}' not found.")
             return None
@@ -47,37 +61,120 @@ class FileSearch:
         """
         Recursively searches for the target file starting from the given path.
 
+        Directories are scanned in parallel, so if several copies of the target
+        file exist, which one is found is not deterministic.
+
         Args:
             path (str): The path to start the search.
         """
-        for root, dirs, files in os.walk(path):
-            if self.target_file in files:
-                self.found_file_path = os.path.join(root, self.target_file)
-                break
+        found_path, _ = self._walk(path, collect_files=False)
+        if found_path:
+            self.found_file_path = found_path
 
     def _get_files_list(self, path):
         """
         Generates a list of files with their properties (path, size, type).
 
+        The type is 'file' for regular files, 'symlink' for symbolic links (sized
+        by the link itself, not its target) and 'other' for special files.
+        Symlinks to directories are skipped.
+
         Args:
             path (str): The path to search for files.
 
         Returns:
-            list: List of dictionaries containing file properties.
+            list: List of dictionaries containing file properties, sorted by path.
         """
-        files_list = []
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_stat = os.stat(file_path)
-                file_info = {
-                    'path': file_path,
-                    'size': file_stat.st_size,
-                    'type': 'file' if os.path.isfile(file_path) else 'directory'
-                }
-                files_list.append(file_info)
+        _, files_list = self._walk(path, collect_files=True)
+        # Threads finish in arbitrary order; sort for stable output
+        files_list.sort(key=lambda file_info: file_info['path'])
         return files_list
 
+    def _walk(self, path, collect_files):
+        """
+        Walks the directory tree on a thread pool, one task per directory.
+
+        The readdir/stat calls release the GIL, so directories are scanned in
+        parallel. When only searching, the walk stops at the first match found
+        by any thread. Collected files are in thread completion order.
+
+        Args:
+            path (str): The path to start the walk.
+            collect_files (bool): Whether to collect file properties instead of searching.
+
+        Returns:
+            tuple: Path of the target file (or None) and the list of collected file properties.
+        """
+        files_list = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending = {executor.submit(self._scan_directory, path, collect_files)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found_path, subdirs, files = future.result()
+                    if found_path and not collect_files:
+                        return found_path, files_list
+                    files_list.extend(files)
+                    for subdir in subdirs:
+                        pending.add(executor.submit(self._scan_directory, subdir, collect_files))
+        finally:
+            executor.shutdown(cancel_futures=True)
+        return None, files_list
+
+    def _scan_directory(self, directory, collect_files):
+        """
+        Scans a single directory with os.scandir.
+
+        Args:
+            directory (str): The directory to scan.
+            collect_files (bool): Whether to stat and collect the files in the directory.
+
+        Returns:
+            tuple: Path of the target file if present (or None), list of subdirectories and list of file properties.
+        """
+        found_path = None
+        subdirs = []
+        files = []
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            return found_path, subdirs, files
+
+        with entries:
+            for entry in entries:
+                # One failing entry (e.g. deleted mid-scan) must not drop the rest of the directory
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    is_symlink = entry.is_symlink()
+                    if is_symlink and entry.is_dir():
+                        # Directory symlinks are neither followed nor listed, as with os.walk
+                        continue
+                    if entry.name == self.target_file and found_path is None:
+                        found_path = entry.path
+                        if not collect_files:
+                            break
+                    if collect_files:
+                        # is_dir()/is_file() reuse the type from the directory read; only one stat per file
+                        file_stat = entry.stat(follow_symlinks=False)
+                        if is_symlink:
+                            file_type = 'symlink'
+                        elif entry.is_file(follow_symlinks=False):
+                            file_type = 'file'
+                        else:
+                            file_type = 'other'
+                        files.append({
+                            'path': entry.path,
+                            'size': file_stat.st_size,
+                            'type': file_type
+                        })
+                except OSError:
+                    continue
+        return found_path, subdirs, files
+
     def _generate_json(self, files_list):
         """
         Generates JSON from the list of files.
@@ -86,9 +183,9 @@ class FileSearch:
             files_list (list): List of dictionaries containing file properties.
 
         Returns:
-            str: JSON string containing file properties.
+            bytes: UTF-8 encoded JSON containing file properties.
         """
-        return json.dumps(files_list, indent=4)
+        return orjson.dumps(files_list, option=orjson.OPT_INDENT_2)
 
 def main():
     # Specify the root path to start the search
@@ -98,12 +195,12 @@ def main():
 
     # Create a FileSearch object
     file_search = FileSearch(start_path, target_file)
-    # Perform the file search and get files information as JSON
-    files_json = file_search()
+    # Perform the file search and get files information as a list of dictionaries
+    files_list = file_search.get_files_list()
 
-    if files_json:
-        # Load JSON into pandas DataFrame
-        df = pd.read_json(files_json)
+    if files_list:
+        # Build the DataFrame directly from the list
+        df = pd.DataFrame(files_list)
 
         # Save DataFrame to CSV
         df.to_csv('files_info.csv', index=False)
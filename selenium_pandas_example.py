@@ -1,109 +1,121 @@
 """
 This script scrapes quotes from the website http://quotes.toscrape.com/.
-It uses Selenium to automate browser actions and BeautifulSoup to parse the HTML content.
+The site is fully server-rendered, so pages are fetched with a plain requests session
+(no browser needed) and parsed with selectolax (lexbor).
 The script performs the following tasks:
 
-1. Initializes a headless Chrome WebDriver to navigate through the website.
+1. Opens a keep-alive HTTP session to navigate through the website.
 2. Scrapes quotes, authors, and associated tags from multiple pages of quotes.
-3. Stores the scraped data in a structured format (list of dictionaries).
+3. Stores the scraped data in a structured format (one list per column).
 4. Saves the collected quotes to both CSV and JSON files.
-5. Implements error handling to manage issues such as missing elements or timeouts.
+5. Implements error handling to manage issues such as failed requests or timeouts.
 6. Uses logging to track progress and capture errors during execution.
 
-To use this script, simply run it in an environment where Selenium and BeautifulSoup are installed.
-Make sure you have the appropriate WebDriver for your browser (e.g., ChromeDriver for Google Chrome).
+To use this script, simply run it in an environment where requests, selectolax and orjson are installed.
 """
 
-import time
-import random
-import pandas as pd
-import json
+import requests
+import csv
+import orjson
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 # Set up logging for tracking the scraping process
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class QuoteScraper:
+    # CSS selectors shared by every page parse
+    _QUOTES = 'div.quote'
+    _TEXT = 'span.text'
+    _AUTHOR = 'small.author'
+    _TAGS = 'a.tag'
+    _NEXT = 'li.next > a'
+
     def __init__(self):
-        # Set up Chrome options and initialize WebDriver
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in headless mode (no GUI)
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        self.driver = webdriver.Chrome(service=ChromeService(), options=chrome_options)
-        self.quotes_list = []
+        # The pages are static HTML, so a keep-alive session replaces the browser
+        self.session = requests.Session()
+        # One list per column (structure of arrays) rather than a dict per quote
+        self.quotes = []
+        self.authors = []
+        self.tags = []
 
     def scrape_page(self, page_url):
-        """Scrape quotes from a single page."""
+        """
+        Scrape quotes from a single page.
+
+        Returns:
+            bool: Whether the page links to a next page.
+        """
         try:
             logging.info(f'Scraping {page_url}...')
-            self.driver.get(page_url)
-            time.sleep(random.uniform(1, 3))  # Random sleep to avoid detection
-            
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            quotes = soup.find_all('div', class_='quote')
-
-            for quote in quotes:
-                text = quote.find('span', class_='text').get_text()
-                author = quote.find('small', class_='author').get_text()
-                tags = [tag.get_text() for tag in quote.find_all('a', class_='tag')]  # Extract tags
-
-                # Append to the quotes list as a dictionary
-                self.quotes_list.append({
-                    'Quote': text,
-                    'Author': author,
-                    'Tags': ', '.join(tags)  # Join tags into a single string
-                })
+            response = self.session.get(page_url, timeout=10)
+            response.raise_for_status()
 
+            quotes, has_next = self.parse_quotes(response.text)
+            self.add_quotes(quotes)
             logging.info(f'Found {len(quotes)} quotes on {page_url}.')
+            return has_next
 
-        except (NoSuchElementException, TimeoutException) as e:
+        except requests.exceptions.RequestException as e:
             logging.error(f"Error while scraping {page_url}: {e}")
-        
-        except WebDriverException as e:
-            logging.error(f"WebDriver error: {e}")
+            return False
+
+    def add_quotes(self, quotes):
+        """Append parsed quote tuples to the per-column quote lists."""
+        for text, author, tags in quotes:
+            self.quotes.append(text)
+            self.authors.append(author)
+            self.tags.append(', '.join(tags))  # Join tags into a single string
+
+    def parse_quotes(self, html):
+        """
+        Extract quotes from a page and check whether it links to a next page.
+
+        Returns:
+            tuple: List of (text, author, tags) tuples and a bool for the next-page link.
+        """
+        # Lexbor is an HTML5 parser and recovers from malformed markup on its own,
+        # so the only thing to guard against is a quote missing its text or author
+        tree = LexborHTMLParser(html)
+        quotes = []
+        for q in tree.css(self._QUOTES):
+            text_node = q.css_first(self._TEXT)
+            author_node = q.css_first(self._AUTHOR)
+            if text_node is None or author_node is None:
+                logging.warning('Skipping a quote without text or author.')
+                continue
+            quotes.append((text_node.text(), author_node.text(), [t.text() for t in q.css(self._TAGS)]))
+        return quotes, tree.css_first(self._NEXT) is not None
 
     def scrape_all_quotes(self):
         """Scrape all quotes from multiple pages until no more pages are available."""
         base_url = 'http://quotes.toscrape.com/page/'
         page_number = 1
         
-        while True:
-            page_url = f'{base_url}{page_number}/'
-            self.scrape_page(page_url)
-
-            # Check if there's a next page
-            try:
-                next_button = self.driver.find_element(By.CSS_SELECTOR, 'li.next > a')
-                if 'next' in next_button.get_attribute('class'):
-                    page_number += 1
-                else:
-                    break
-            except NoSuchElementException:
-                break
+        # Keep going while each page links to a next page
+        while self.scrape_page(f'{base_url}{page_number}/'):
+            page_number += 1
 
     def save_to_csv(self, file_path):
         """Save scraped quotes to a CSV file."""
-        df = pd.DataFrame(self.quotes_list)
-        df.to_csv(file_path, index=False)
+        # Small fixed-schema output: write rows directly rather than building a DataFrame
+        with open(file_path, 'w', newline='', encoding='utf-8') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(['Quote', 'Author', 'Tags'])
+            writer.writerows(zip(self.quotes, self.authors, self.tags))
         logging.info(f'Saved quotes to {file_path}.')
 
     def save_to_json(self, file_path):
         """Save scraped quotes to a JSON file."""
-        with open(file_path, 'w') as json_file:
-            json.dump(self.quotes_list, json_file, indent=4)
+        with open(file_path, 'wb') as json_file:
+            records = [{'Quote': quote, 'Author': author, 'Tags': tags}
+                       for quote, author, tags in zip(self.quotes, self.authors, self.tags)]
+            json_file.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
         logging.info(f'Saved quotes to {file_path}.')
 
-    def close_driver(self):
-        """Close the WebDriver."""
-        self.driver.quit()
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
 
 def main():
     scraper = QuoteScraper()
@@ -116,7 +128,7 @@ def main():
         scraper.save_to_json('quotes.json')
 
     finally:
-        scraper.close_driver()
+        scraper.close()
 
 if __name__ == '__main__':
     main()
@@ -8,7 +8,7 @@ The script performs the following tasks:
 
 The script is organized into the following components:
 
-    TwitterAPI Class: This class is responsible for interacting with the Twitter API. It has a method to fetch the followers of a specified user.
+    TwitterAPI Class: This class is responsible for interacting with the Twitter API. It has a method that fetches the followers of a specified user page by page.
 
     TwitterProcessor Class: This class processes the followers' data obtained from the Twitter API. It extracts relevant information such as user ID and likes.
 
@@ -19,6 +19,8 @@ The script is organized into the following components:
 '''
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sqlite3
 
 class TwitterAPI:
@@ -27,21 +29,37 @@ class TwitterAPI:
         self.bearer_token = bearer_token
         self.base_url = "https://api.twitter.com/2/"
 
-    def get_followers(self):
+        # One keep-alive session with the auth header set once
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Authorization": f"Bearer {self.bearer_token}"})
+
+    def get_followers(self, max_results=1000):
         """
-        Fetches followers data from Twitter API.
+        Fetches followers data from Twitter API, following pagination tokens.
 
-        Returns:
-            dict: Followers data in JSON format.
+        Args:
+            max_results (int, optional): Followers per page (the API maximum is 1000). Defaults to 1000.
+
+        Yields:
+            dict: One page of followers data in JSON format.
         """
         url = f"{self.base_url}users/{self.user_id}/followers"
-        headers = {"Authorization": f"Bearer {self.bearer_token}"}
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print("Error:", response.text)
-            return None
+        params = {"max_results": max_results}
+        while True:
+            response = self.session.get(url, params=params)
+            if response.status_code != 200:
+                print("Error:", response.text)
+                return
+            page = response.json()
+            yield page
+
+            next_token = page.get('meta', {}).get('next_token')
+            if not next_token:
+                return
+            params["pagination_token"] = next_token
 
 class TwitterProcessor:
     def process_likes(self, followers_data):
@@ -54,26 +72,24 @@ class TwitterProcessor:
         Returns:
             dict: Dictionary containing follower IDs and their respective likes count.
         """
-        likes_count = {}
-        followers = followers_data.get('data', [])
-        for follower in followers:
-            likes_count[follower['id']] = follower.get('likes', 0)
-        return likes_count
+        return {follower['id']: follower.get('likes', 0) for follower in followers_data.get('data', [])}
 
 class DatabaseHandler:
     def __init__(self, db_name):
         self.db_name = db_name
+        # One connection for every page of inserts; the PRAGMAs only need setting once
+        self.conn = sqlite3.connect(self.db_name)
+        self.conn.execute("PRAGMA synchronous=OFF")
+        self.conn.execute("PRAGMA journal_mode=WAL")
 
     def create_table(self):
         """
         Creates a table in the database if it doesn't exist.
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        cursor = self.conn.cursor()
         cursor.execute('''CREATE TABLE IF NOT EXISTS followers_likes
                           (follower_id INTEGER PRIMARY KEY, likes INTEGER)''')
-        conn.commit()
-        conn.close()
+        self.conn.commit()
 
     def insert_likes(self, likes_count):
         """
@@ -82,14 +98,18 @@ class DatabaseHandler:
         Args:
             likes_count (dict): Dictionary containing follower IDs and their respective likes count.
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        for follower_id, likes in likes_count.items():
-            cursor.execute("INSERT INTO followers_likes (follower_id, likes) VALUES (?, ?)", (follower_id, likes))
-        conn.commit()
-        conn.close()
+        cursor = self.conn.cursor()
+        # Single statement for the whole batch, committed as one transaction
+        cursor.executemany("INSERT INTO followers_likes (follower_id, likes) VALUES (?, ?)", list(likes_count.items()))
+        self.conn.commit()
         print("Data inserted into the database.")
 
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.conn.close()
+
 def main():
     user_id = "your_user_id"
     bearer_token = "your_bearer_token"
@@ -97,21 +117,23 @@ def main():
 
     # Initialize Twitter API object
     twitter_api = TwitterAPI(user_id, bearer_token)
-    # Get followers data
-    followers_data = twitter_api.get_followers()
-
-    if followers_data:
-        # Initialize Twitter Processor object
-        twitter_processor = TwitterProcessor()
-        # Process followers' likes
-        likes_count = twitter_processor.process_likes(followers_data)
-
-        # Initialize Database Handler object
-        db_handler = DatabaseHandler(db_name)
-        # Create table if not exists
-        db_handler.create_table()
-        # Insert likes into database
-        db_handler.insert_likes(likes_count)
+    # Initialize Twitter Processor object
+    twitter_processor = TwitterProcessor()
+
+    # Initialize Database Handler object
+    db_handler = DatabaseHandler(db_name)
+    # Create table if not exists
+    db_handler.create_table()
+
+    try:
+        # Stream followers page by page so only one page is held in memory
+        for followers_data in twitter_api.get_followers():
+            # Process followers' likes
+            likes_count = twitter_processor.process_likes(followers_data)
+            # Insert this page's likes into database
+            db_handler.insert_likes(likes_count)
+    finally:
+        db_handler.close()
 
 if __name__ == "__main__":
     main()